@@ -4,21 +4,25 @@ Panel Visibility Diagnostic Script
 Identifies blocking behavior preventing Syncfusion DockingManager panels from appearing.
 
 Usage:
-    python tools/diagnose-panel-visibility.py [--fix] [--verbose]
+    python tools/diagnose-panel-visibility.py [--fix] [--verbose] [--incremental]
 
 Based on analysis from approved-workflow.md and Syncfusion v32.x+ best practices.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
+import subprocess
 import sys
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """Represents a detected panel visibility issue."""
 
@@ -32,83 +36,485 @@ class Issue:
     auto_fixable: bool = False
 
 
+# Per-line rule metadata: (severity, category, description, fix, auto_fixable).
+# The description may reference {detail} from the recorded hit.
+_LINE_RULES: dict[str, tuple[str, str, str, str, bool]] = {
+    "visibility_blocker": (
+        "critical",
+        "visibility_blocker",
+        "CRITICAL: {detail} - Sets Visible=false which prevents panels from rendering",
+        "Remove this line or set to 'true' after panels are docked",
+        True,
+    ),
+    "size_bounds": (
+        "high",
+        "size_bounds",
+        "Control size set to zero - will be invisible",
+        "Set proper Width/Height or use Dock/Anchor properties",
+        False,
+    ),
+    "opacity": (
+        "medium",
+        "opacity",
+        "Opacity set to 0 - control will be invisible",
+        "Remove opacity setting or set to 1.0",
+        True,
+    ),
+}
+
+
+class PendingIssue(NamedTuple):
+    """Raw per-line hit; formatted into an Issue only when the report is built."""
+
+    rule: str
+    file_path: Path
+    line_num: int
+    line: str
+    detail: str = ""
+
+    def materialize(self) -> Issue:
+        """Expand this hit into a full Issue using its rule metadata."""
+        severity, category, description, fix, auto_fixable = _LINE_RULES[self.rule]
+        return Issue(
+            severity=severity,
+            category=category,
+            file_path=self.file_path,
+            line_num=self.line_num,
+            line_content=self.line.strip(),
+            description=description.format(detail=self.detail),
+            fix_suggestion=fix,
+            auto_fixable=auto_fixable,
+        )
+
+
 @dataclass
 class DiagnosticReport:
     """Complete diagnostic report for panel visibility issues."""
 
     issues: list[Issue] = field(default_factory=list)
+    # Per-line hits with the len(issues) at which each was recorded.
+    pending: list[tuple[int, PendingIssue]] = field(default_factory=list)
     summary: dict[str, Any] = field(default_factory=dict)
     docking_system_used: str = ""
     panels_created: list[str] = field(default_factory=list)
     theme_application_timing: str = ""
 
 
+@dataclass(frozen=True)
+class DiagSpec:
+    """Every compiled regex and literal token the checks consult, built once."""
+
+    visible_false_re: re.Pattern[str]
+    visible_false_labels: dict[str, str]
+    panel_creation_patterns: dict[str, re.Pattern[str]]
+    zero_size_re: re.Pattern[str]
+    zero_opacity_re: re.Pattern[str]
+    panel_parent_re: re.Pattern[str]
+    odd_line_break_re: re.Pattern[str]
+    comment_line_re: re.Pattern[str]
+    line_anchors: dict[str, tuple[str, ...]]
+    literal_tokens: frozenset[str]
+
+
+# Visible=false blockers keyed by group name: (regex, description).
+_VISIBLE_FALSE_RULES = {
+    "host_control": (
+        r"hostControl\.Visible\s*=\s*false",
+        "DockingHostFactory hostControl visibility blocker",
+    ),
+    "docking_host": (
+        r"_dockingHost\.Visible\s*=\s*false",
+        "MainForm docking host visibility blocker",
+    ),
+    "left_panel": (
+        r"leftDockPanel\.Visible\s*=\s*false",
+        "Left panel explicitly hidden",
+    ),
+    "right_panel": (
+        r"rightDockPanel\.Visible\s*=\s*false",
+        "Right panel explicitly hidden",
+    ),
+    "central_panel": (
+        r"centralDocumentPanel\.Visible\s*=\s*false",
+        "Central panel explicitly hidden",
+    ),
+}
+
+
+def _named_alternation(patterns: dict[str, str]) -> re.Pattern[str]:
+    """Compile patterns into one alternation; match.lastgroup names the winner."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{rx})" for name, rx in patterns.items()), re.ASCII
+    )
+
+
+# Every token these checks look for is an ASCII C# identifier, so patterns are
+# compiled once with re.ASCII to keep \s and \w on the ASCII fast path.
+_SPEC = DiagSpec(
+    visible_false_re=_named_alternation(
+        {name: rx for name, (rx, _) in _VISIBLE_FALSE_RULES.items()}
+    ),
+    visible_false_labels={
+        name: label for name, (_, label) in _VISIBLE_FALSE_RULES.items()
+    },
+    panel_creation_patterns={
+        "leftDockPanel": re.compile(r"_leftDockPanel\s*=\s*new\s+Panel", re.ASCII),
+        "rightDockPanel": re.compile(r"_rightDockPanel\s*=\s*new\s+Panel", re.ASCII),
+        "centralDocumentPanel": re.compile(
+            r"_centralDocumentPanel\s*=\s*new\s+Panel", re.ASCII
+        ),
+        "dockingHost": re.compile(
+            r"_dockingHost\s*=\s*new\s+ContainerControl", re.ASCII
+        ),
+    },
+    zero_size_re=re.compile(
+        r"(Width|Height|Size)\s*=\s*(0|new\s+Size\(0[^0-9])", re.ASCII
+    ),
+    zero_opacity_re=re.compile(r"Opacity\s*=\s*0", re.ASCII),
+    # One pass over a line finds panel creations and both ways of parenting
+    # them; the named group that matched says which.
+    panel_parent_re=re.compile(
+        r"(?P<create>\w+DockPanel|_\w+DockPanel|\w+Host)\s*=\s*new\s+"
+        r"|Controls\.Add\((?P<addctrl>\w+(?:DockPanel|Host))\)"
+        r"|DockControl\((?P<dockctrl>\w+(?:DockPanel|Host))",
+        re.ASCII,
+    ),
+    # Line boundaries str.splitlines() honours besides \n and \r\n.
+    odd_line_break_re=re.compile(
+        r"[\v\f\x1c\x1d\x1e\x85\u2028\u2029]|\r(?!\n)", re.ASCII
+    ),
+    comment_line_re=re.compile(r"[ \t]*//", re.ASCII),
+    # Literal substrings every hit of a per-line rule must contain. Files and
+    # lines without one are skipped before the regex engine is involved.
+    line_anchors={
+        "visibility_blocker": ("Visible",),
+        "size_bounds": ("Width", "Height", "Size"),
+        "opacity": ("Opacity",),
+    },
+    # Literal markers the architecture checks test for; _scan_file resolves them
+    # once per file so the checks only do set lookups. Anything without regex
+    # metacharacters belongs here (or in a plain `in` test), never in re.search.
+    literal_tokens=frozenset(
+        {
+            "DockingHostFactory.CreateDockingHost",
+            "private void InitializeSyncfusionDocking()",
+            "_dockingHost?.SendToBack()",
+            "_ribbon?.BringToFront()",
+            "_statusBar?.BringToFront()",
+            "private void ApplyDockingTheme()",
+            "DEPRECATED: This class exists only for backward compatibility",
+            "protected override void OnPaint",
+            "base.OnPaint",
+            "Controls.Add(_dockingHost)",
+            "_dockingHost.Dock = DockStyle.Fill",
+            "leftDockPanel",
+            "rightDockPanel",
+            "centralDocumentPanel",
+            "SetEnableDocking",
+            "DockControl",
+            "Controls.Add",
+            "PerformLayout",
+            "IsHandleCreated",
+            "EnsureCreated",
+            "NewDockStateEndLoad",
+        }
+    ),
+)
+
+
+def _anchored_lines(
+    content: str, anchors: tuple[str, ...]
+) -> Iterator[tuple[int, str]]:
+    """Yield (line_num, line) only for code lines containing one of the anchors.
+
+    Lines are sliced out of content on demand rather than splitting the whole
+    file, so files with no or few anchor hits never build a list of lines.
+    Line numbers follow str.splitlines(); content with any line boundary other
+    than \n or \r\n is split up front instead. Whole-line // comments are
+    skipped before any slice is made; every per-line rule ignores them anyway.
+    """
+    # Each anchor's next hit is cached and only searched for again once the
+    # scan has moved past it, so every anchor walks the content once.
+    next_hit = {anchor: content.find(anchor) for anchor in anchors}
+    if all(i < 0 for i in next_hit.values()):
+        return
+
+    if _SPEC.odd_line_break_re.search(content):
+        for line_num, line in enumerate(content.splitlines(), start=1):
+            if _SPEC.comment_line_re.match(line):
+                continue
+            if any(anchor in line for anchor in anchors):
+                yield line_num, line
+        return
+
+    line_num = 1
+    counted_to = 0
+    pos = 0
+    while True:
+        for anchor, i in next_hit.items():
+            if 0 <= i < pos:
+                next_hit[anchor] = content.find(anchor, pos)
+        hits = [i for i in next_hit.values() if i >= 0]
+        if not hits:
+            return
+        hit = min(hits)
+        start = content.rfind("\n", 0, hit) + 1
+        end = content.find("\n", hit)
+        if end < 0:
+            end = len(content)
+        pos = end + 1
+        if _SPEC.comment_line_re.match(content, start):
+            continue
+        line_num += content.count("\n", counted_to, start)
+        counted_to = start
+        yield line_num, content[start:end].rstrip("\r")
+
+
+# Build-output and VCS directories are pruned from the source walk entirely.
+_EXCLUDED_DIRS = frozenset({"bin", "obj", ".git"})
+
+# Sidecar written by --incremental runs: a digest of this script's rules, the
+# commit scanned, flagged files, and a (size, mtime_ns) fingerprint per file.
+_STATE_FILE = Path("tools/.diag_state.json")
+
+
+def _scan_file(spec: DiagSpec, content: str) -> frozenset[str]:
+    """Report which spec literal tokens a source file's content contains."""
+    return frozenset(t for t in spec.literal_tokens if t in content)
+
+
 class PanelVisibilityDiagnostic:
     """Diagnose panel visibility blocking issues in WinForms docking setup."""
 
-    def __init__(self, workspace_root: Path, verbose: bool = False):
+    def __init__(
+        self, workspace_root: Path, verbose: bool = False, incremental: bool = False
+    ):
         self.workspace_root = workspace_root
         self.verbose = verbose
+        self.incremental = incremental
         self.report = DiagnosticReport()
+        self._cs_files: list[tuple[Path, bool, int, int]] | None = None
+        # Files the src-wide scanners must read; None means scan everything.
+        self._rescan: set[Path] | None = None
+        # Several checks inspect the same files, so each is read at most once.
+        self._raw_cache: dict[Path, bytes] = {}
+        self._text_cache: dict[Path, str] = {}
+        self._lines_cache: dict[Path, list[str]] = {}
+        self._tokens_cache: dict[Path, frozenset[str]] = {}
 
     def log(self, message: str) -> None:
         """Log message if verbose mode enabled."""
         if self.verbose:
             print(f"[DEBUG] {message}")
 
-    def scan_for_visible_false_assignments(self) -> None:
-        """Scan for critical 'Visible = false' assignments that block panels."""
-        self.log("Scanning for Visible=false assignments...")
+    def _add_pending(self, hit: PendingIssue) -> None:
+        """Queue a per-line hit at its place among the findings so far."""
+        self.report.pending.append((len(self.report.issues), hit))
+
+    def _read_bytes(self, path: Path) -> bytes:
+        """Return a file's raw bytes, reading it from disk only once."""
+        data = self._raw_cache.get(path)
+        if data is None:
+            data = self._raw_cache[path] = path.read_bytes()
+        return data
+
+    def _read(self, path: Path) -> str:
+        """Return a file's decoded text, decoding it only once."""
+        content = self._text_cache.get(path)
+        if content is None:
+            content = self._text_cache[path] = self._read_bytes(path).decode("utf-8")
+        return content
+
+    def _lines(self, path: Path) -> list[str]:
+        """Return a file's lines, splitting it only once."""
+        lines = self._lines_cache.get(path)
+        if lines is None:
+            lines = self._lines_cache[path] = self._read(path).splitlines()
+        return lines
+
+    def _tokens(self, path: Path) -> frozenset[str]:
+        """Return the spec literal tokens present in a file, resolved once."""
+        tokens = self._tokens_cache.get(path)
+        if tokens is None:
+            tokens = self._tokens_cache[path] = _scan_file(_SPEC, self._read(path))
+        return tokens
+
+    def _read_anchored(self, path: Path, anchors: tuple[str, ...]) -> str | None:
+        """Return the decoded file only if its raw bytes contain one of the anchors.
+
+        Anchors are ASCII, so the test runs on undecoded bytes and the UTF-8
+        decode is paid only by the minority of files that can produce a hit.
+        """
+        data = self._read_bytes(path)
+        if not any(anchor.encode("ascii") in data for anchor in anchors):
+            return None
+        return self._read(path)
+
+    def _iter_cs_files(self, src_only: bool = True) -> list[Path]:
+        """Return the workspace's C# files, walking the tree only once.
+
+        By default only files below a src/ directory at any depth are returned,
+        which is what rglob("src/**/*.cs") matched.
+        """
+        if self._cs_files is None:
+            self._cs_files = []
+            # Depth-first in the order os.walk yields files: a directory's own
+            # files first, then each subdirectory in listing order.
+            pending = [(self.workspace_root, False)]
+            while pending:
+                dir_path, in_src = pending.pop()
+                try:
+                    entries = os.scandir(dir_path)
+                except OSError as exc:
+                    self.log(f"Error walking source tree: {exc}")
+                    continue
+                subdirs: list[tuple[Path, bool]] = []
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _EXCLUDED_DIRS:
+                                subdirs.append(
+                                    (Path(entry.path), in_src or entry.name == "src")
+                                )
+                        elif entry.name.endswith(".cs"):
+                            try:
+                                stat = entry.stat()
+                            except OSError as exc:
+                                self.log(f"Error reading {entry.path}: {exc}")
+                                continue
+                            self._cs_files.append(
+                                (
+                                    Path(entry.path),
+                                    in_src,
+                                    stat.st_size,
+                                    stat.st_mtime_ns,
+                                )
+                            )
+                pending.extend(reversed(subdirs))
+        return [
+            path
+            for path, in_src, _, _ in self._cs_files
+            if (in_src or not src_only)
+            and (self._rescan is None or path in self._rescan)
+        ]
 
-        patterns = [
-            (
-                r"hostControl\.Visible\s*=\s*false",
-                "DockingHostFactory hostControl visibility blocker",
-            ),
-            (
-                r"_dockingHost\.Visible\s*=\s*false",
-                "MainForm docking host visibility blocker",
-            ),
-            (r"leftDockPanel\.Visible\s*=\s*false", "Left panel explicitly hidden"),
-            (r"rightDockPanel\.Visible\s*=\s*false", "Right panel explicitly hidden"),
-            (
-                r"centralDocumentPanel\.Visible\s*=\s*false",
-                "Central panel explicitly hidden",
+    def _git_lines(self, *args: str) -> list[str] | None:
+        """Run a git command in the workspace and return its output lines."""
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(self.workspace_root), *args],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except OSError as exc:
+            self.log(f"git unavailable: {exc}")
+            return None
+        if result.returncode != 0:
+            self.log(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+            return None
+        return [line for line in result.stdout.splitlines() if line]
+
+    def _rules_digest(self) -> str:
+        """Fingerprint this script so edited rules invalidate saved state."""
+        return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+    def load_incremental_state(self) -> None:
+        """Limit src-wide scans to files changed or flagged since the last run."""
+        state_path = self.workspace_root / _STATE_FILE
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.log("No previous diagnostic state - running full scan")
+            return
+        if state.get("rules") != self._rules_digest():
+            self.log("Diagnostic rules changed since last run - running full scan")
+            return
+
+        # Previously flagged files are always rescanned so fixes get verified.
+        rescan = {self.workspace_root / rel for rel in state.get("flagged", [])}
+
+        # Any file whose size or mtime moved (or that is new) is rescanned.
+        known = state.get("files", {})
+        root = self.workspace_root
+        for path, _, size, mtime_ns in self._cs_files or ():
+            if known.get(path.relative_to(root).as_posix()) != [size, mtime_ns]:
+                rescan.add(path)
+
+        # git also catches edits that preserved size and mtime.
+        if state.get("commit"):
+            changed = self._git_lines(
+                "diff", "--name-only", "--relative", state["commit"]
+            )
+            rescan.update(root / rel for rel in changed or ())
+
+        self._rescan = rescan
+        print(f"⚡ Incremental: rescanning {len(rescan)} changed/flagged file(s)")
+
+    def save_incremental_state(self) -> None:
+        """Record rules, commit, flagged files and file fingerprints atomically."""
+        head = self._git_lines("rev-parse", "HEAD")
+        root = self.workspace_root
+        state = {
+            "rules": self._rules_digest(),
+            "commit": head[0] if head else None,
+            "flagged": sorted(
+                {
+                    issue.file_path.relative_to(root).as_posix()
+                    for issue in self.report.issues
+                }
             ),
-        ]
+            "files": {
+                path.relative_to(root).as_posix(): [size, mtime_ns]
+                for path, _, size, mtime_ns in self._cs_files or ()
+            },
+        }
 
-        cs_files = list(self.workspace_root.rglob("src/**/*.cs"))
+        state_path = root / _STATE_FILE
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        os.replace(tmp_path, state_path)
 
-        for cs_file in cs_files:
-            if any(x in str(cs_file) for x in ["bin", "obj", ".git"]):
-                continue
+    def scan_for_visible_false_assignments(self) -> None:
+        """Scan for critical 'Visible = false' assignments that block panels."""
+        self.log("Scanning for Visible=false assignments...")
 
+        for cs_file in self._iter_cs_files():
             try:
-                content = cs_file.read_text(encoding="utf-8")
-                lines = content.splitlines()
-
-                for line_num, line in enumerate(lines, start=1):
-                    for pattern, description in patterns:
-                        if re.search(pattern, line):
-                            # Check if it's in a comment
-                            if "//" in line and line.index("//") < line.index(
-                                "Visible"
-                            ):
-                                continue
+                anchors = _SPEC.line_anchors["visibility_blocker"]
+                content = self._read_anchored(cs_file, anchors)
+                if content is None:
+                    continue
 
-                            self.report.issues.append(
-                                Issue(
-                                    severity="critical",
-                                    category="visibility_blocker",
-                                    file_path=cs_file,
-                                    line_num=line_num,
-                                    line_content=line.strip(),
-                                    description=f"CRITICAL: {description} - Sets Visible=false which prevents panels from rendering",
-                                    fix_suggestion="Remove this line or set to 'true' after panels are docked",
-                                    auto_fixable=True,
-                                )
+                for line_num, line in _anchored_lines(content, anchors):
+                    # One C-level pass per line covers every blocker pattern.
+                    fired = {
+                        m.lastgroup
+                        for m in _SPEC.visible_false_re.finditer(line)
+                        if m.lastgroup
+                    }
+                    if not fired:
+                        continue
+
+                    # Check if it's in a comment
+                    if "//" in line and line.index("//") < line.index("Visible"):
+                        continue
+
+                    # Each pattern that fired is reported once, in rule order.
+                    for name, label in _SPEC.visible_false_labels.items():
+                        if name not in fired:
+                            continue
+                        self._add_pending(
+                            PendingIssue(
+                                "visibility_blocker",
+                                cs_file,
+                                line_num,
+                                line,
+                                label,
                             )
-                            self.log(f"Found visibility blocker: {cs_file}:{line_num}")
+                        )
+                        self.log(f"Found visibility blocker: {cs_file}:{line_num}")
             except Exception as e:
                 self.log(f"Error scanning {cs_file}: {e}")
 
@@ -123,11 +529,11 @@ class PanelVisibilityDiagnostic:
 
         # Check if MainForm calls DockingHostFactory
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
-            if "DockingHostFactory.CreateDockingHost" in content:
+            tokens = self._tokens(mainform_docking)
+            if "DockingHostFactory.CreateDockingHost" in tokens:
                 self.report.docking_system_used = "DockingHostFactory (factory pattern)"
                 self.log("MainForm uses DockingHostFactory - recommended pattern")
-            elif "private void InitializeSyncfusionDocking()" in content:
+            elif "private void InitializeSyncfusionDocking()" in tokens:
                 self.report.docking_system_used = (
                     "MainForm.Docking.cs (direct initialization)"
                 )
@@ -168,68 +574,72 @@ class PanelVisibilityDiagnostic:
         )
 
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
-            lines = content.splitlines()
+            tokens = self._tokens(mainform_docking)
+            lines = self._lines(mainform_docking)
 
             # Check if using factory pattern (panels created by factory)
-            if "DockingHostFactory.CreateDockingHost" in content:
+            if "DockingHostFactory.CreateDockingHost" in tokens:
                 self.log("Using DockingHostFactory - panel creation handled by factory")
                 # Factory creates panels, so skip detailed panel creation checks
                 return
 
-            # Track panel creation
-            panel_patterns = {
-                "leftDockPanel": r"_leftDockPanel\s*=\s*new\s+Panel",
-                "rightDockPanel": r"_rightDockPanel\s*=\s*new\s+Panel",
-                "centralDocumentPanel": r"_centralDocumentPanel\s*=\s*new\s+Panel",
-                "dockingHost": r"_dockingHost\s*=\s*new\s+ContainerControl",
-            }
-
-            for panel_name, pattern in panel_patterns.items():
-                found = False
-                for line_num, line in enumerate(lines, start=1):
-                    if re.search(pattern, line):
-                        self.report.panels_created.append(panel_name)
-                        self.log(
-                            f"Found panel creation: {panel_name} at line {line_num}"
+            content = self._read(mainform_docking)
+
+            for panel_name, pattern in _SPEC.panel_creation_patterns.items():
+                # Only the first creation matters, so the line walk stops at the
+                # first hit. Every pattern contains its panel name literally, so
+                # a substring test rules most panels out without any regex.
+                # Matching stays per line, and line numbers come from the same
+                # lines the look-ahead below indexes.
+                line_num = 0
+                if panel_name in content:
+                    line_num = next(
+                        (
+                            num
+                            for num, line in enumerate(lines, start=1)
+                            if pattern.search(line)
+                        ),
+                        0,
+                    )
+                if not line_num:
+                    if panel_name != "dockingHost":
+                        self.report.issues.append(
+                            Issue(
+                                severity="medium",
+                                category="panel_creation",
+                                file_path=mainform_docking,
+                                line_num=0,
+                                line_content="",
+                                description=f"Panel {panel_name} not found in CreateDockPanels()",
+                                fix_suggestion="Verify panel is created in CreateDockPanels() method",
+                                auto_fixable=False,
+                            )
                         )
-                        found = True
-
-                        # Check if Visible is set in creation block
-                        # Look ahead a few lines
-                        for offset in range(0, min(10, len(lines) - line_num)):
-                            check_line = lines[line_num + offset - 1]
-                            if (
-                                "Visible = false" in check_line
-                                and panel_name.replace("_", "") in check_line
-                            ):
-                                self.report.issues.append(
-                                    Issue(
-                                        severity="critical",
-                                        category="visibility_blocker",
-                                        file_path=mainform_docking,
-                                        line_num=line_num + offset,
-                                        line_content=check_line.strip(),
-                                        description=f"Panel {panel_name} created with Visible=false",
-                                        fix_suggestion="Remove Visible=false or set to true",
-                                        auto_fixable=True,
-                                    )
-                                )
-                        break
+                    continue
 
-                if not found and panel_name != "dockingHost":
-                    self.report.issues.append(
-                        Issue(
-                            severity="medium",
-                            category="panel_creation",
-                            file_path=mainform_docking,
-                            line_num=0,
-                            line_content="",
-                            description=f"Panel {panel_name} not found in CreateDockPanels()",
-                            fix_suggestion="Verify panel is created in CreateDockPanels() method",
-                            auto_fixable=False,
+                self.report.panels_created.append(panel_name)
+                self.log(f"Found panel creation: {panel_name} at line {line_num}")
+
+                # Check if Visible is set in creation block
+                # Look ahead a few lines
+                for offset in range(0, min(10, len(lines) - line_num)):
+                    check_line = lines[line_num + offset - 1]
+                    if (
+                        "Visible = false" in check_line
+                        and panel_name.replace("_", "") in check_line
+                    ):
+                        self.report.issues.append(
+                            Issue(
+                                severity="critical",
+                                category="visibility_blocker",
+                                file_path=mainform_docking,
+                                line_num=line_num + offset,
+                                line_content=check_line.strip(),
+                                description=f"Panel {panel_name} created with Visible=false",
+                                fix_suggestion="Remove Visible=false or set to true",
+                                auto_fixable=True,
+                            )
                         )
-                    )
 
     def check_z_order_issues(self) -> None:
         """Check for Z-order issues with ribbon/status bar covering panels."""
@@ -241,14 +651,14 @@ class PanelVisibilityDiagnostic:
         )
 
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
+            tokens = self._tokens(mainform_docking)
 
             # If using factory pattern, host management is internal
-            uses_factory = "DockingHostFactory.CreateDockingHost" in content
+            uses_factory = "DockingHostFactory.CreateDockingHost" in tokens
 
             if not uses_factory:
                 # Check for proper Z-order management
-                has_sendtoback = "_dockingHost?.SendToBack()" in content
+                has_sendtoback = "_dockingHost?.SendToBack()" in tokens
                 if not has_sendtoback:
                     self.report.issues.append(
                         Issue(
@@ -266,8 +676,8 @@ class PanelVisibilityDiagnostic:
                 self.log("Using DockingHostFactory - Z-order handled by factory")
 
             # Always check ribbon/status bar (independent of factory)
-            has_bringtofront_ribbon = "_ribbon?.BringToFront()" in content
-            has_bringtofront_status = "_statusBar?.BringToFront()" in content
+            has_bringtofront_ribbon = "_ribbon?.BringToFront()" in tokens
+            has_bringtofront_status = "_statusBar?.BringToFront()" in tokens
 
             if not (has_bringtofront_ribbon and has_bringtofront_status):
                 self.report.issues.append(
@@ -297,8 +707,7 @@ class PanelVisibilityDiagnostic:
 
         # Check if theme applied in constructor (too early)
         if mainform_cs.exists():
-            content = mainform_cs.read_text(encoding="utf-8")
-            lines = content.splitlines()
+            lines = self._lines(mainform_cs)
 
             in_constructor = False
             for line_num, line in enumerate(lines, start=1):
@@ -319,9 +728,9 @@ class PanelVisibilityDiagnostic:
 
         # Check if theme applied after docking initialization
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
+            tokens = self._tokens(mainform_docking)
 
-            if "private void ApplyDockingTheme()" in content:
+            if "private void ApplyDockingTheme()" in tokens:
                 self.report.theme_application_timing = "Post-docking (ideal)"
                 self.log("Theme has dedicated ApplyDockingTheme() method (good)")
             else:
@@ -348,19 +757,19 @@ class PanelVisibilityDiagnostic:
         )
 
         if legacy_panel.exists():
-            content = legacy_panel.read_text(encoding="utf-8")
+            tokens = self._tokens(legacy_panel)
 
             # Check if it's just a stub (good)
             if (
                 "DEPRECATED: This class exists only for backward compatibility"
-                in content
+                in tokens
             ):
                 self.log(
                     "LegacyGradientPanel is just a stub/wrapper - no custom paint issues"
                 )
-            elif "protected override void OnPaint" in content:
+            elif "protected override void OnPaint" in tokens:
                 # Has custom paint - check if base.OnPaint called
-                if "base.OnPaint" not in content:
+                if "base.OnPaint" not in tokens:
                     self.report.issues.append(
                         Issue(
                             severity="high",
@@ -384,14 +793,14 @@ class PanelVisibilityDiagnostic:
         )
 
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
+            tokens = self._tokens(mainform_docking)
 
             # If using factory pattern, host integration is handled by factory
-            uses_factory = "DockingHostFactory.CreateDockingHost" in content
+            uses_factory = "DockingHostFactory.CreateDockingHost" in tokens
 
             if not uses_factory:
                 # Check if docking host added to form controls
-                if "Controls.Add(_dockingHost)" not in content:
+                if "Controls.Add(_dockingHost)" not in tokens:
                     self.report.issues.append(
                         Issue(
                             severity="critical",
@@ -406,7 +815,7 @@ class PanelVisibilityDiagnostic:
                     )
 
                 # Check if docking host docked to fill
-                if "_dockingHost.Dock = DockStyle.Fill" not in content:
+                if "_dockingHost.Dock = DockStyle.Fill" not in tokens:
                     self.report.issues.append(
                         Issue(
                             severity="high",
@@ -429,20 +838,21 @@ class PanelVisibilityDiagnostic:
         """Check for SuspendLayout without matching ResumeLayout."""
         self.log("Checking SuspendLayout/ResumeLayout balance...")
 
-        cs_files = list(self.workspace_root.rglob("src/**/*.cs"))
-
-        for cs_file in cs_files:
-            if any(x in str(cs_file) for x in ["bin", "obj", ".git"]):
-                continue
-
+        for cs_file in self._iter_cs_files():
             try:
-                content = cs_file.read_text(encoding="utf-8")
-                lines = content.splitlines()
+                # No suspend call means nothing can be out of balance, so most
+                # files are ruled out before they are even decoded.
+                content = self._read_anchored(cs_file, ("SuspendLayout()",))
+                if content is None:
+                    continue
 
                 suspend_count = 0
                 resume_count = 0
 
-                for line_num, line in enumerate(lines, start=1):
+                # Only lines holding either call are sliced out and tallied.
+                for _, line in _anchored_lines(
+                    content, ("SuspendLayout()", "ResumeLayout")
+                ):
                     if (
                         "SuspendLayout()" in line
                         and "//" not in line[: line.index("SuspendLayout")]
@@ -479,7 +889,7 @@ class PanelVisibilityDiagnostic:
         )
 
         if docking_factory.exists():
-            content = docking_factory.read_text(encoding="utf-8")
+            content = self._read(docking_factory)
 
             begin_count = content.count("BeginInit()")
             end_count = content.count("EndInit()")
@@ -512,8 +922,8 @@ class PanelVisibilityDiagnostic:
 
         # Check mainform first
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
-            uses_factory = "DockingHostFactory.CreateDockingHost" in content
+            tokens = self._tokens(mainform_docking)
+            uses_factory = "DockingHostFactory.CreateDockingHost" in tokens
 
             if uses_factory:
                 # Factory handles SetEnableDocking internally
@@ -527,18 +937,14 @@ class PanelVisibilityDiagnostic:
             if not file_path.exists():
                 continue
 
-            content = file_path.read_text(encoding="utf-8")
+            tokens = self._tokens(file_path)
 
             # Check if panels are created but not enabled for docking
-            has_left_panel = "leftDockPanel" in content or "_leftDockPanel" in content
-            has_right_panel = (
-                "rightDockPanel" in content or "_rightDockPanel" in content
-            )
-            has_central_panel = (
-                "centralDocumentPanel" in content or "_centralDocumentPanel" in content
-            )
+            has_left_panel = "leftDockPanel" in tokens
+            has_right_panel = "rightDockPanel" in tokens
+            has_central_panel = "centralDocumentPanel" in tokens
 
-            has_enable_docking = "SetEnableDocking" in content
+            has_enable_docking = "SetEnableDocking" in tokens
 
             if (
                 has_left_panel or has_right_panel or has_central_panel
@@ -573,11 +979,11 @@ class PanelVisibilityDiagnostic:
             if not file_path.exists():
                 continue
 
-            content = file_path.read_text(encoding="utf-8")
+            tokens = self._tokens(file_path)
 
             # Check if SetEnableDocking exists but DockControl doesn't
-            has_enable_docking = "SetEnableDocking" in content
-            has_dock_control = "DockControl" in content
+            has_enable_docking = "SetEnableDocking" in tokens
+            has_dock_control = "DockControl" in tokens
 
             if has_enable_docking and not has_dock_control:
                 self.report.issues.append(
@@ -604,10 +1010,10 @@ class PanelVisibilityDiagnostic:
         )
 
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
+            tokens = self._tokens(mainform_docking)
 
-            has_controls_add = "Controls.Add" in content
-            has_perform_layout = "PerformLayout" in content
+            has_controls_add = "Controls.Add" in tokens
+            has_perform_layout = "PerformLayout" in tokens
 
             if has_controls_add and not has_perform_layout:
                 self.report.issues.append(
@@ -627,37 +1033,27 @@ class PanelVisibilityDiagnostic:
         """Check for potential size/bounds issues that could make panels invisible."""
         self.log("Checking size and bounds configurations...")
 
-        cs_files = []
-        for pattern in ["**/MainForm*.cs", "**/DockingHostFactory.cs"]:
-            cs_files.extend(self.workspace_root.rglob(pattern))
-
-        for cs_file in cs_files:
-            if any(x in str(cs_file) for x in ["bin", "obj", ".git"]):
-                continue
-
+        # These files may live outside src/ (tests, tooling). MainForm*.cs come
+        # first, then DockingHostFactory.cs, the order the two globs gave.
+        cs_files = self._iter_cs_files(src_only=False)
+        for cs_file in [
+            *(path for path in cs_files if path.name.startswith("MainForm")),
+            *(path for path in cs_files if path.name == "DockingHostFactory.cs"),
+        ]:
             try:
-                content = cs_file.read_text(encoding="utf-8")
-                lines = content.splitlines()
+                anchors = _SPEC.line_anchors["size_bounds"]
+                content = self._read_anchored(cs_file, anchors)
+                if content is None:
+                    continue
 
                 # Check for zero size assignments
-                for line_num, line in enumerate(lines, start=1):
-                    if re.search(
-                        r"(Width|Height|Size)\s*=\s*(0|new\s+Size\(0[^0-9])", line
-                    ):
+                for line_num, line in _anchored_lines(content, anchors):
+                    if _SPEC.zero_size_re.search(line):
                         if "//" in line and line.index("/") < line.index("="):
                             continue
 
-                        self.report.issues.append(
-                            Issue(
-                                severity="high",
-                                category="size_bounds",
-                                file_path=cs_file,
-                                line_num=line_num,
-                                line_content=line.strip(),
-                                description="Control size set to zero - will be invisible",
-                                fix_suggestion="Set proper Width/Height or use Dock/Anchor properties",
-                                auto_fixable=False,
-                            )
+                        self._add_pending(
+                            PendingIssue("size_bounds", cs_file, line_num, line)
                         )
             except Exception as exc:
                 self.log(f"Error checking size/bounds in {cs_file}: {exc}")
@@ -666,32 +1062,20 @@ class PanelVisibilityDiagnostic:
         """Check for Opacity set to 0 making controls invisible."""
         self.log("Checking opacity settings...")
 
-        cs_files = list(self.workspace_root.rglob("src/**/*.cs"))
-
-        for cs_file in cs_files:
-            if any(x in str(cs_file) for x in ["bin", "obj", ".git"]):
-                continue
-
+        for cs_file in self._iter_cs_files():
             try:
-                content = cs_file.read_text(encoding="utf-8")
-                lines = content.splitlines()
+                anchors = _SPEC.line_anchors["opacity"]
+                content = self._read_anchored(cs_file, anchors)
+                if content is None:
+                    continue
 
-                for line_num, line in enumerate(lines, start=1):
-                    if re.search(r"Opacity\s*=\s*0", line):
+                for line_num, line in _anchored_lines(content, anchors):
+                    if _SPEC.zero_opacity_re.search(line):
                         if "//" in line:
                             continue
 
-                        self.report.issues.append(
-                            Issue(
-                                severity="medium",
-                                category="opacity",
-                                file_path=cs_file,
-                                line_num=line_num,
-                                line_content=line.strip(),
-                                description="Opacity set to 0 - control will be invisible",
-                                fix_suggestion="Remove opacity setting or set to 1.0",
-                                auto_fixable=True,
-                            )
+                        self._add_pending(
+                            PendingIssue("opacity", cs_file, line_num, line)
                         )
             except Exception as exc:
                 self.log(f"Error checking opacity in {cs_file}: {exc}")
@@ -712,34 +1096,24 @@ class PanelVisibilityDiagnostic:
             if not file_path.exists():
                 continue
 
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.splitlines()
-
             # Track panel creation and parent assignment
             panels_created = set()
             panels_parented = set()
 
-            for line in lines:
-                # Track creation
-                if match := re.search(
-                    r"(\w+DockPanel|_\w+DockPanel|\w+Host)\s*=\s*new\s+", line
-                ):
-                    panel_name = match.group(1)
-                    panels_created.add(panel_name)
-
-                # Track parenting
-                if match := re.search(
-                    r"Controls\.Add\((\w+(?:DockPanel|Host))\)", line
-                ):
-                    panel_name = match.group(1)
-                    panels_parented.add(panel_name)
-                if match := re.search(r"DockControl\((\w+(?:DockPanel|Host))", line):
-                    panel_name = match.group(1)
-                    panels_parented.add(panel_name)
+            for line in self._lines(file_path):
+                # Matching stays within a line, and only the first hit of each
+                # kind per line counts, as with one re.search per kind.
+                first: dict[str, str] = {}
+                for match in _SPEC.panel_parent_re.finditer(line):
+                    if match.lastgroup:
+                        first.setdefault(match.lastgroup, match[match.lastgroup])
+                if "create" in first:
+                    panels_created.add(first.pop("create"))
+                panels_parented.update(first.values())
 
             orphaned = panels_created - panels_parented
             if orphaned:
-                for panel in orphaned:
+                for panel in sorted(orphaned):
                     self.report.issues.append(
                         Issue(
                             severity="high",
@@ -763,10 +1137,10 @@ class PanelVisibilityDiagnostic:
         )
 
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
+            tokens = self._tokens(mainform_docking)
 
             # Check if CreateHandle or EnsureCreated is called
-            if "IsHandleCreated" not in content and "EnsureCreated" not in content:
+            if "IsHandleCreated" not in tokens and "EnsureCreated" not in tokens:
                 self.report.issues.append(
                     Issue(
                         severity="low",
@@ -790,10 +1164,10 @@ class PanelVisibilityDiagnostic:
         )
 
         if mainform_docking.exists():
-            content = mainform_docking.read_text(encoding="utf-8")
+            tokens = self._tokens(mainform_docking)
 
             # Check for NewDockStateEndLoad handler (important for Syncfusion)
-            if "NewDockStateEndLoad" not in content:
+            if "NewDockStateEndLoad" not in tokens:
                 self.report.issues.append(
                     Issue(
                         severity="medium",
@@ -809,6 +1183,18 @@ class PanelVisibilityDiagnostic:
 
     def generate_summary(self) -> None:
         """Generate summary statistics for the report."""
+        # Per-line hits are only formatted now, once every check has run. Each
+        # goes back where it was recorded, so the report keeps check order.
+        issues: list[Issue] = []
+        start = 0
+        for pos, hit in self.report.pending:
+            issues.extend(self.report.issues[start:pos])
+            issues.append(hit.materialize())
+            start = pos
+        issues.extend(self.report.issues[start:])
+        self.report.issues = issues
+        self.report.pending.clear()
+
         self.report.summary = {
             "total_issues": len(self.report.issues),
             "critical": len(
@@ -827,6 +1213,9 @@ class PanelVisibilityDiagnostic:
         """Run all diagnostic checks."""
         print("🔍 Starting Panel Visibility Diagnostics (Enhanced)...")
         print(f"📂 Workspace: {self.workspace_root}")
+        if self.incremental:
+            self._iter_cs_files()
+            self.load_incremental_state()
         print()
 
         # Core visibility blockers
@@ -858,6 +1247,9 @@ class PanelVisibilityDiagnostic:
 
         self.generate_summary()
 
+        if self.incremental:
+            self.save_incremental_state()
+
         return self.report
 
     def print_report(self) -> None:
@@ -963,6 +1355,11 @@ def main() -> int:
         default=Path.cwd(),
         help="Workspace root directory (default: current directory)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Only rescan files changed since the last run (state in {_STATE_FILE})",
+    )
 
     args = parser.parse_args()
 
@@ -971,7 +1368,9 @@ def main() -> int:
         print(f"❌ Error: Workspace not found: {workspace}", file=sys.stderr)
         return 1
 
-    diagnostic = PanelVisibilityDiagnostic(workspace, verbose=args.verbose)
+    diagnostic = PanelVisibilityDiagnostic(
+        workspace, verbose=args.verbose, incremental=args.incremental
+    )
     diagnostic.run_diagnostics()
     diagnostic.print_report()
 